@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Benchmark render time and peak memory of the LaTeX stats report tables.
+
+Statistics are computed on synthetic seasons shaped like the play-by-play
+parquet files before timing starts, so only the string-building phase is
+measured. ``--legacy`` renders the same frames through the previous
+``DataFrame.to_latex(longtable=True, escape=True)`` path, which joined every
+section into one string.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from generate_full_stats_report import (
+    NON_NUMERIC_COLUMN_FORMATS,
+    NON_NUMERIC_TEXT_COLUMNS,
+    NUMERIC_COLUMN_FORMATS,
+    NUMERIC_TEXT_COLUMNS,
+    _build_column_format,
+    _compute_non_numeric_stats,
+    _compute_numeric_stats,
+    _write_latex_table,
+)
+
+
+def _synthetic_season(rows: int, numeric_cols: int, text_cols: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    data: dict[str, object] = {}
+    for i in range(numeric_cols):
+        values = rng.normal(size=rows)
+        values[rng.random(rows) < 0.3] = np.nan
+        data[f"num_stat_{i}"] = values
+    teams = np.array(["KC", "SF", "BUF", "PHI", "DAL", "GB", "NE", "LA"])
+    for i in range(text_cols):
+        data[f"text_col_{i}"] = teams[rng.integers(0, len(teams), size=rows)]
+    return pd.DataFrame(data)
+
+
+def _legacy_table(df: pd.DataFrame, caption: str, column_format: str | None) -> str:
+    latex_table = df.to_latex(
+        index=False,
+        longtable=True,
+        escape=True,
+        column_format=column_format,
+    )
+    return (
+        f"\\paragraph{{{caption}}}\n"
+        "\\begingroup\\setlength{\\tabcolsep}{4pt}\\scriptsize\n"
+        f"{latex_table}\n"
+        "\\endgroup\n"
+    )
+
+
+def _render_legacy(tables: list[tuple[pd.DataFrame, str | None, tuple[str, ...]]]) -> None:
+    with open(os.devnull, "w", encoding="utf-8") as handle:
+        handle.write("\n".join(_legacy_table(df, "Summary", fmt) for df, fmt, _ in tables))
+
+
+def _render_streaming(tables: list[tuple[pd.DataFrame, str | None, tuple[str, ...]]]) -> None:
+    with open(os.devnull, "w", encoding="utf-8") as handle:
+        for df, fmt, text_columns in tables:
+            _write_latex_table(handle, df, "Summary", fmt, text_columns)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seasons", type=int, default=27)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--numeric-cols", type=int, default=300)
+    parser.add_argument("--text-cols", type=int, default=70)
+    parser.add_argument("--legacy", action="store_true", help="render with DataFrame.to_latex")
+    args = parser.parse_args()
+
+    tables = []
+    for seed in range(args.seasons):
+        df = _synthetic_season(args.rows, args.numeric_cols, args.text_cols, seed)
+        numeric_stats = _compute_numeric_stats(df)
+        non_numeric_stats = _compute_non_numeric_stats(df)
+        tables.append(
+            (
+                numeric_stats,
+                _build_column_format(numeric_stats, NUMERIC_COLUMN_FORMATS),
+                NUMERIC_TEXT_COLUMNS,
+            )
+        )
+        tables.append(
+            (
+                non_numeric_stats,
+                _build_column_format(non_numeric_stats, NON_NUMERIC_COLUMN_FORMATS),
+                NON_NUMERIC_TEXT_COLUMNS,
+            )
+        )
+
+    render = _render_legacy if args.legacy else _render_streaming
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    render(tables)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"Renderer: {'to_latex (legacy)' if args.legacy else 'streaming'}")
+    print(f"Seasons: {args.seasons} ({args.numeric_cols + args.text_cols} columns each)")
+    print(f"Render time: {elapsed:.2f}s")
+    print(f"Peak traced memory: {peak / 1024**2:.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
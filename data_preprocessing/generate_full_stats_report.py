@@ -4,9 +4,11 @@
 from __future__ import annotations
 
 import math
+import shutil
+import tempfile
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable, Tuple
+from typing import Iterable, TextIO, Tuple
 
 import numpy as np
 import pandas as pd
@@ -22,19 +24,20 @@ REPORT_DIR.mkdir(parents=True, exist_ok=True)
 pd.options.mode.copy_on_write = True
 
 
-def _format_float(value: float, digits: int = 6) -> str:
-    """Return a nicely formatted float string or an empty string for NaN."""
-    if value is None or (isinstance(value, float) and math.isnan(value)):
-        return ""
-    return f"{value:.{digits}f}"
-
-
 def _format_percent(value: float) -> str:
     if value is None or (isinstance(value, float) and math.isnan(value)):
         return ""
     return f"{value:.2f}"
 
 
+def _format_float_array(values: pd.Series, spec: str = "%.6f") -> np.ndarray:
+    """Format a whole numeric column with ``spec``, leaving NaN cells empty."""
+    array = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    formatted = np.char.mod(spec, array).astype(object)
+    formatted[np.isnan(array)] = ""
+    return formatted
+
+
 def _compute_numeric_stats(df: pd.DataFrame) -> pd.DataFrame:
     numeric_cols = df.select_dtypes(include=[np.number]).columns.to_list()
     if not numeric_cols:
@@ -58,11 +61,11 @@ def _compute_numeric_stats(df: pd.DataFrame) -> pd.DataFrame:
 
     stats["non_null"] = stats["non_null"].astype(int)
     stats["distinct"] = stats["distinct"].astype(int)
-    stats["missing_pct"] = stats["missing_pct"].apply(_format_percent)
+    stats["missing_pct"] = _format_float_array(stats["missing_pct"], "%.2f")
 
     float_cols = ["mean", "std", "min", "p25", "median", "p75", "max"]
     for col in float_cols:
-        stats[col] = stats[col].apply(_format_float)
+        stats[col] = _format_float_array(stats[col])
 
     return stats
 
@@ -127,30 +130,95 @@ def _build_column_format(df: pd.DataFrame, text_overrides: dict[str, str]) -> st
     return "".join(parts)
 
 
-def _df_to_latex(df: pd.DataFrame, caption: str, column_format: str | None = None) -> str:
-    if df.empty:
-        return "\\paragraph{} No columns in this category.\n"
-    latex_table = df.to_latex(
-        index=False,
-        longtable=True,
-        escape=True,
-        column_format=column_format,
-    )
+def _escape_latex(text: str) -> str:
+    """Escape LaTeX special characters exactly like ``DataFrame.to_latex``."""
+    # Mirrors pandas.io.formats.style_render._escape_latex (pandas 2.x/3.x, whose
+    # to_latex renders through Styler; pandas 1.x lays longtables out differently).
+    # Backslashes are swapped for a placeholder first so the "\\" introduced by
+    # the later replacements are not escaped a second time.
     return (
-        f"\\paragraph{{{caption}}}\n"
-        "\\begingroup\\setlength{\\tabcolsep}{4pt}\\scriptsize\n"
-        f"{latex_table}\n"
-        "\\endgroup\n"
+        text.replace("\\", "ab2§=§8yz")
+        .replace("ab2§=§8yz ", "ab2§=§8yz\\space ")
+        .replace("&", "\\&")
+        .replace("%", "\\%")
+        .replace("$", "\\$")
+        .replace("#", "\\#")
+        .replace("_", "\\_")
+        .replace("{", "\\{")
+        .replace("}", "\\}")
+        .replace("~ ", "~\\space ")
+        .replace("~", "\\textasciitilde ")
+        .replace("^ ", "^\\space ")
+        .replace("^", "\\textasciicircum ")
+        .replace("ab2§=§8yz", "\\textbackslash ")
     )
 
 
-def _build_document(sections: Iterable[str], summary_table: pd.DataFrame) -> str:
+def _write_lines(handle: TextIO, lines: Iterable[str]) -> None:
+    for line in lines:
+        handle.write(line)
+        handle.write("\n")
+
+
+def _write_latex_table(
+    handle: TextIO,
+    df: pd.DataFrame,
+    caption: str,
+    column_format: str | None = None,
+    text_columns: Iterable[str] = (),
+) -> None:
+    """Stream ``df`` as a longtable, matching ``to_latex(longtable=True, escape=True)``.
+
+    Only ``text_columns`` can contain LaTeX special characters; every other
+    column holds pre-formatted numbers and is written without escaping.
+    """
+    if df.empty:
+        _write_lines(handle, ["\\paragraph{} No columns in this category.\n"])
+        return
+
+    text_columns = set(text_columns)
+    header = " & ".join(_escape_latex(str(col)) for col in df.columns) + " \\\\"
+    cells = [
+        [_escape_latex(value) for value in df[col].astype(str)]
+        if col in text_columns
+        else df[col].astype(str).to_list()
+        for col in df.columns
+    ]
+
+    handle.write(f"\\paragraph{{{caption}}}\n")
+    handle.write("\\begingroup\\setlength{\\tabcolsep}{4pt}\\scriptsize\n")
+    _write_lines(
+        handle,
+        [
+            f"\\begin{{longtable}}{{{column_format}}}",
+            "\\toprule",
+            header,
+            "\\midrule",
+            "\\endfirsthead",
+            "\\toprule",
+            header,
+            "\\midrule",
+            "\\endhead",
+            "\\midrule",
+            f"\\multicolumn{{{len(df.columns)}}}{{r}}{{Continued on next page}} \\\\",
+            "\\midrule",
+            "\\endfoot",
+            "\\bottomrule",
+            "\\endlastfoot",
+        ],
+    )
+    _write_lines(handle, (" & ".join(row) + " \\\\" for row in zip(*cells)))
+    _write_lines(handle, ["\\end{longtable}", "", "\\endgroup", ""])
+
+
+def _write_document(handle: TextIO, body: TextIO, summary_table: pd.DataFrame) -> None:
+    """Write the preamble and overview table, then copy the streamed season sections."""
     today = datetime.now().strftime("%B %d, %Y")
     header = [
         "\\documentclass{article}",
         "\\usepackage{booktabs}",
         "\\usepackage{longtable}",
-    "\\usepackage{array}",
+        "\\usepackage{array}",
         "\\usepackage{geometry}",
         "\\usepackage{pdflscape}",
         "\\geometry{margin=1in}",
@@ -178,85 +246,95 @@ def _build_document(sections: Iterable[str], summary_table: pd.DataFrame) -> str
         )
     )
     header.append("\\clearpage")
+    _write_lines(handle, header)
 
-    document = header + list(sections) + ["\\end{document}"]
-    return "\n".join(document)
+    body.seek(0)
+    shutil.copyfileobj(body, handle)
+    handle.write("\\end{document}")
 
 
-def main() -> None:
-    parquet_files = sorted(RAW_DATA_DIR.glob("play_by_play_*.parquet"))
-    if not parquet_files:
-        raise FileNotFoundError("No play_by_play_*.parquet files found in raw_data directory")
+NUMERIC_COLUMN_FORMATS = {
+    "column": "p{4.5cm}",
+}
+NON_NUMERIC_COLUMN_FORMATS = {
+    "column": "p{4.5cm}",
+    "top": "p{4.5cm}",
+    "sample_min": "p{4.5cm}",
+    "sample_max": "p{4.5cm}",
+}
 
-    sections: list[str] = []
-    summary_records = []
+# Columns that may contain LaTeX special characters; the rest are formatted numbers.
+NUMERIC_TEXT_COLUMNS = ("column",)
+NON_NUMERIC_TEXT_COLUMNS = ("column", "top", "sample_min", "sample_max")
 
-    for dataset_path in parquet_files:
-        df = pd.read_parquet(dataset_path)
-        year = dataset_path.stem.split("_")[-1]
-        rows, columns = df.shape
 
-        numeric_stats = _compute_numeric_stats(df)
-        non_numeric_stats = _compute_non_numeric_stats(df)
+def _write_season_section(handle: TextIO, year: str, df: pd.DataFrame) -> dict[str, object]:
+    """Write one season's section to ``handle`` and return its overview record."""
+    rows, columns = df.shape
 
-        numeric_format = _build_column_format(
-            numeric_stats,
-            {
-                "column": "p{4.5cm}",
-            },
-        )
-        non_numeric_format = _build_column_format(
-            non_numeric_stats,
-            {
-                "column": "p{4.5cm}",
-                "top": "p{4.5cm}",
-                "sample_min": "p{4.5cm}",
-                "sample_max": "p{4.5cm}",
-            },
-        )
+    numeric_stats = _compute_numeric_stats(df)
+    non_numeric_stats = _compute_non_numeric_stats(df)
 
-        sections.append(f"\\section{{Season {year}}}")
-        sections.append(f"\\noindent\\textbf{{Rows}}: {rows:,}\\newline")
-        sections.append(f"\\noindent\\textbf{{Columns}}: {columns}\\newline")
-        sections.append(
-            f"\\noindent\\textbf{{Numeric Columns}}: {numeric_stats.shape[0]}\\newline"
-        )
-        sections.append(
-            f"\\noindent\\textbf{{Non-numeric Columns}}: {non_numeric_stats.shape[0]}\\newline"
-        )
-        sections.append("\\begin{landscape}")
-        sections.append(
-            _df_to_latex(
-                numeric_stats,
-                "Numeric column summary",
-                column_format=numeric_format,
-            )
-        )
-        sections.append("\\clearpage")
-        sections.append(
-            _df_to_latex(
-                non_numeric_stats,
-                "Non-numeric column summary",
-                column_format=non_numeric_format,
-            )
-        )
-        sections.append("\\end{landscape}")
-        sections.append("\\clearpage")
+    numeric_format = _build_column_format(numeric_stats, NUMERIC_COLUMN_FORMATS)
+    non_numeric_format = _build_column_format(
+        non_numeric_stats, NON_NUMERIC_COLUMN_FORMATS
+    )
 
-        summary_records.append(
-            {
-                "Year": year,
-                "Rows": rows,
-                "Columns": columns,
-                "Numeric Columns": numeric_stats.shape[0],
-                "Non-numeric Columns": non_numeric_stats.shape[0],
-            }
-        )
+    _write_lines(
+        handle,
+        [
+            f"\\section{{Season {year}}}",
+            f"\\noindent\\textbf{{Rows}}: {rows:,}\\newline",
+            f"\\noindent\\textbf{{Columns}}: {columns}\\newline",
+            f"\\noindent\\textbf{{Numeric Columns}}: {numeric_stats.shape[0]}\\newline",
+            f"\\noindent\\textbf{{Non-numeric Columns}}: {non_numeric_stats.shape[0]}\\newline",
+            "\\begin{landscape}",
+        ],
+    )
+    _write_latex_table(
+        handle,
+        numeric_stats,
+        "Numeric column summary",
+        column_format=numeric_format,
+        text_columns=NUMERIC_TEXT_COLUMNS,
+    )
+    _write_lines(handle, ["\\clearpage"])
+    _write_latex_table(
+        handle,
+        non_numeric_stats,
+        "Non-numeric column summary",
+        column_format=non_numeric_format,
+        text_columns=NON_NUMERIC_TEXT_COLUMNS,
+    )
+    _write_lines(handle, ["\\end{landscape}", "\\clearpage"])
 
-    summary_table = pd.DataFrame(summary_records)
-    latex_doc = _build_document(sections, summary_table)
+    return {
+        "Year": year,
+        "Rows": rows,
+        "Columns": columns,
+        "Numeric Columns": numeric_stats.shape[0],
+        "Non-numeric Columns": non_numeric_stats.shape[0],
+    }
+
+
+def main() -> None:
+    parquet_files = sorted(RAW_DATA_DIR.glob("play_by_play_*.parquet"))
+    if not parquet_files:
+        raise FileNotFoundError("No play_by_play_*.parquet files found in raw_data directory")
+
+    summary_records = []
 
-    REPORT_PATH.write_text(latex_doc, encoding="utf-8")
+    # Season sections are streamed to a scratch file because the overview
+    # table that precedes them is only known once every season is processed.
+    with tempfile.TemporaryFile("w+", encoding="utf-8", dir=REPORT_DIR) as body:
+        for dataset_path in parquet_files:
+            df = pd.read_parquet(dataset_path)
+            year = dataset_path.stem.split("_")[-1]
+            summary_records.append(_write_season_section(body, year, df))
+
+        summary_table = pd.DataFrame(summary_records)
+        with REPORT_PATH.open("w", encoding="utf-8") as handle:
+            _write_document(handle, body, summary_table)
 
 
 if __name__ == "__main__":